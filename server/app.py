@@ -1,52 +1,230 @@
-from flask import Flask, request, jsonify
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
+from flask import Flask, Response, request, jsonify, g, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_migrate import Migrate, stamp
 from flask_cors import CORS
+from ciso8601 import parse_datetime
+from sqlalchemy import event as sa_event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import now
 from datetime import datetime, timezone
+import hashlib
+import orjson
 import os
 import re
+import sqlite3
+
+from db_settings import DATABASE_URL, IS_SQLITE, IS_IN_MEMORY, POOL_SIZE, MAX_OVERFLOW
+from extensions import db, cache, cache_get, cache_set, CACHE_MAX_BODY
+from models import Event, EventGuest, Task, RSVP_STATUSES, empty_rsvp_summary
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which serializes datetimes natively"""
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(self, obj, indent=False):
+        option = self.option | orjson.OPT_INDENT_2 if indent else self.option
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, indent=bool(kwargs.get('indent'))).decode()
+
+    def response(self, *args, **kwargs):
+        """Like the default jsonify response, but hands orjson's bytes straight to the response"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent), mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///event_planner.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
 
+# Connection pool: reuse warm connections instead of opening one per request
+engine_options = {
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
+if IS_SQLITE:
+    engine_options['connect_args'] = {'check_same_thread': False}
+if not IS_IN_MEMORY:
+    engine_options['pool_size'] = POOL_SIZE
+    engine_options['max_overflow'] = MAX_OVERFLOW
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
+@sa_event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling on SQLite so readers don't block behind writers, and enforce foreign keys (ON DELETE CASCADE)"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+@compiles(now, 'sqlite')
+def sqlite_now(element, compiler, **kw):
+    """SQLite's CURRENT_TIMESTAMP is whole seconds; keep milliseconds so back-to-back writes get distinct timestamps"""
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
 # Initialize extensions
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
+db.init_app(app)
+# Batch mode lets migrations alter SQLite tables; the directory is found relative to this file, not the cwd
+migrate = Migrate(app, db, directory=os.path.join(os.path.dirname(__file__), 'migrations'), render_as_batch=True)
 CORS(app)
 
-# Import and create models after db initialization
-from models import create_models
-Event, EventGuest, Task = create_models(db)
+@app.after_request
+def commit_request(response):
+    """Commit each write request as a single transaction"""
+    if request.method in ('GET', 'HEAD', 'OPTIONS'):
+        # Nothing to commit, and GET /events may still be streaming from an open cursor
+        return response
+    if response.status_code >= 400:
+        db.session.rollback()
+        return response
+
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        # after_request must return a response object, not a (body, status) tuple
+        return app.make_response((jsonify({'error': str(e)}), 500))
+    return response
 
 # Validation helper functions
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_RSVP_STATUSES = frozenset(RSVP_STATUSES)
+
 def validate_email(email):
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def validate_rsvp_status(status):
-    return status in ['Yes', 'No', 'Maybe']
+    return status in _RSVP_STATUSES
+
+def utc_now():
+    """Current UTC time, read once per request and reused by the date checks"""
+    if '_utc_now' not in g:
+        g._utc_now = datetime.now(timezone.utc)
+    return g._utc_now
 
 def parse_iso_datetime_aware(date_str):
     try:
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        if not isinstance(date_str, str):
+            raise ValueError
+        dt = parse_datetime(date_str)
         if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
     except ValueError:
         raise ValueError("Invalid date format. Use ISO format (YYYY-MM-DDTHH:MM:SS)")
 
+def serialize_event(event, rsvp_summary):
+    """Build the response dict for an event in one step, leaving datetimes to orjson"""
+    return {
+        'id': event.id,
+        'title': event.title,
+        'description': event.description,
+        'location': event.location,
+        'date': event.date,
+        'created_at': event.created_at,
+        'updated_at': event.updated_at,
+        'rsvp_summary': rsvp_summary
+    }
+
+def events_etag(event_id=None):
+    """
+    ETag for the event list, or for a single event when an id is given,
+    derived from row counts and the latest updated_at of events and RSVPs
+    so it changes on any insert, update or delete without reading the rows.
+    """
+    event_filter = [] if event_id is None else [Event.id == event_id]
+    rsvp_filter = [] if event_id is None else [EventGuest.event_id == event_id]
+    fingerprint = db.session.execute(select(
+        select(func.count(Event.id)).where(*event_filter).scalar_subquery(),
+        select(func.max(Event.updated_at)).where(*event_filter).scalar_subquery(),
+        select(func.count(EventGuest.id)).where(*rsvp_filter).scalar_subquery(),
+        select(func.max(EventGuest.updated_at)).where(*rsvp_filter).scalar_subquery()
+    )).one()
+    return hashlib.md5(repr(tuple(fingerprint)).encode(), usedforsecurity=False).hexdigest()
+
+def json_response(body, etag):
+    """200 response for an already-encoded JSON body, tagged for conditional requests"""
+    response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
 @app.route('/events', methods=['GET'])
 def get_events():
     try:
-        events = Event.query.all()
-        events_data = [event.to_dict() | {'rsvp_summary': event.get_rsvp_summary()} for event in events]
-        return jsonify(events_data), 200
+        etag = events_etag()
+        if etag in request.if_none_match:
+            return not_modified(etag)
+
+        # Keyed by ETag, so a write makes the old body unreachable rather than needing a delete
+        cache_key = f'events:list:{etag}'
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return json_response(cached, etag)
+
+        # One grouped query for every event's RSVP counts
+        summaries = EventGuest.get_rsvp_summaries()
+
+        # Plain column rows, fetched from the cursor in batches rather than all at once
+        rows = db.session.execute(
+            select(Event.id, Event.title, Event.description, Event.location,
+                   Event.date, Event.created_at, Event.updated_at)
+            .execution_options(yield_per=500)
+        )
+
+        empty_summary = empty_rsvp_summary()
+
+        def encode(partition):
+            return b','.join(
+                app.json.dumps_bytes(serialize_event(row, summaries.get(row.id, empty_summary)))
+                for row in partition
+            )
+
+        # Encode the first batch before the 200 goes out, so query and row decoding
+        # errors still get the JSON 500 below; a failure in a later batch can only cut the stream short
+        partitions = rows.partitions()
+        first_chunk = b'[' + encode(next(partitions, ()))
+
+        def chunks():
+            yield first_chunk
+            for partition in partitions:
+                yield b',' + encode(partition)
+            yield b']'
+
+        def generate():
+            # Keep a copy of the body for the cache only while it stays under CACHE_MAX_BODY,
+            # so large listings still stream in bounded memory and just aren't cached
+            buffered = [] if cache is not None else None
+            buffered_size = 0
+            for chunk in chunks():
+                if buffered is not None:
+                    buffered_size += len(chunk)
+                    if buffered_size > CACHE_MAX_BODY:
+                        buffered = None
+                    else:
+                        buffered.append(chunk)
+                yield chunk
+            if buffered is not None:
+                cache_set(cache_key, b''.join(buffered))
+
+        return json_response(stream_with_context(generate()), etag)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -65,7 +243,7 @@ def create_event():
 
         try:
             event_date = parse_iso_datetime_aware(date_str)
-            if event_date <= datetime.now(timezone.utc):
+            if event_date <= utc_now():
                 return jsonify({'error': 'Date must be in the future'}), 400
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
@@ -78,7 +256,7 @@ def create_event():
         )
 
         db.session.add(new_event)
-        db.session.commit()
+        db.session.flush()
         return jsonify(new_event.to_dict()), 201
 
     except Exception as e:
@@ -88,13 +266,24 @@ def create_event():
 @app.route('/events/<int:event_id>', methods=['GET'])
 def get_single_event(event_id):
     try:
-        event = Event.query.get(event_id)
+        etag = events_etag(event_id)
+        if etag in request.if_none_match:
+            return not_modified(etag)
+
+        cache_key = f'events:{event_id}:{etag}'
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return json_response(cached, etag)
+
+        event = db.session.get(Event, event_id)
         if not event:
             return jsonify({'error': 'Event not found'}), 404
 
         event_data = event.to_dict()
-        event_data['rsvp_summary'] = event.get_rsvp_summary() if hasattr(event, 'get_rsvp_summary') else {}
-        return jsonify(event_data), 200
+        event_data['rsvp_summary'] = event.get_rsvp_summary()
+        body = app.json.dumps_bytes(event_data)
+        cache_set(cache_key, body)
+        return json_response(body, etag)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -102,7 +291,7 @@ def get_single_event(event_id):
 @app.route('/events/<int:event_id>', methods=['PATCH'])
 def update_event(event_id):
     try:
-        event = Event.query.get(event_id)
+        event = db.session.get(Event, event_id)
         if not event:
             return jsonify({'error': 'Event not found'}), 404
 
@@ -127,14 +316,13 @@ def update_event(event_id):
                 return jsonify({'error': 'Date cannot be empty'}), 400
             try:
                 event_date = parse_iso_datetime_aware(date_str)
-                if event_date <= datetime.now(timezone.utc):
+                if event_date <= utc_now():
                     return jsonify({'error': 'Date must be in the future'}), 400
                 event.date = event_date
             except ValueError as e:
                 return jsonify({'error': str(e)}), 400
 
-        event.updated_at = datetime.now(timezone.utc)
-        db.session.commit()
+        db.session.flush()
         return jsonify(event.to_dict()), 200
 
     except Exception as e:
@@ -144,12 +332,12 @@ def update_event(event_id):
 @app.route('/events/<int:event_id>', methods=['DELETE'])
 def delete_event(event_id):
     try:
-        event = Event.query.get(event_id)
+        event = db.session.get(Event, event_id)
         if not event:
             return jsonify({'error': 'Event not found'}), 404
 
         db.session.delete(event)
-        db.session.commit()
+        db.session.flush()
 
         return jsonify({'message': f'Event {event_id} deleted successfully'}), 200
 
@@ -161,7 +349,16 @@ def delete_event(event_id):
 def health_check():
     return jsonify({'status': 'healthy'}), 200
 
+@app.cli.command('init-db')
+def init_db():
+    """Create all database tables and mark the schema as current for migrations"""
+    db.create_all()
+    stamp()
+
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
+    # Development server only; production runs through wsgi.py under gunicorn
+    if os.environ.get('INIT_DB'):
+        with app.app_context():
+            db.create_all()
+            stamp()
     app.run(debug=True, port=5000)
@@ -0,0 +1,23 @@
+"""
+Database URL and connection limits, shared by the app's engine (app.py) and the
+gunicorn worker settings (gunicorn.conf.py) so both size against the same pool
+"""
+from sqlalchemy.engine import make_url
+import os
+
+DATABASE_URL = os.environ.get('DATABASE_URL', 'sqlite:///event_planner.db')
+
+_url = make_url(DATABASE_URL)
+IS_SQLITE = _url.get_backend_name() == 'sqlite'
+# An in-memory SQLite database lives on one shared connection (Flask-SQLAlchemy gives it a
+# StaticPool), which doesn't take pool sizing; SQLite files use a QueuePool like other databases
+IS_IN_MEMORY = IS_SQLITE and _url.database in (None, '', ':memory:')
+
+# Connections each process's pool may hold. SQLite allows one writer per file at a time,
+# so it gets a small pool rather than many threads queuing on the write lock.
+POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 4 if IS_SQLITE else 10))
+MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 0 if IS_SQLITE else 20))
+
+# Connections all processes together may open: under PostgreSQL's default max_connections
+# of 100 with some left for migrations and admin sessions, or a handful of writers per SQLite file
+CONNECTION_BUDGET = int(os.environ.get('DB_CONNECTION_BUDGET', 8 if IS_SQLITE else 90))
@@ -0,0 +1,28 @@
+from flask_sqlalchemy import SQLAlchemy
+import os
+import redis
+
+# Shared extension instances; bound to the app in app.py with init_app()
+db = SQLAlchemy()
+
+# Redis cache shared by every worker; disabled unless REDIS_URL is set
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 60))
+# Largest streamed response body buffered for caching; bigger ones are served uncached
+CACHE_MAX_BODY = int(os.environ.get('CACHE_MAX_BODY', 1024 * 1024))
+cache = redis.Redis.from_url(os.environ['REDIS_URL']) if os.environ.get('REDIS_URL') else None
+
+def cache_get(key):
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except redis.RedisError:
+        return None
+
+def cache_set(key, body):
+    if cache is None:
+        return
+    try:
+        cache.setex(key, CACHE_TTL, body)
+    except redis.RedisError:
+        pass
@@ -0,0 +1,25 @@
+"""
+Gunicorn settings, picked up automatically when gunicorn is started from this directory
+
+gthread workers serve requests on a pool of OS threads. The database drivers
+(sqlite3, psycopg2) block in C, so threads rather than greenlets are what let
+a worker keep serving while one request waits on the database.
+"""
+import multiprocessing
+import os
+
+from db_settings import POOL_SIZE, MAX_OVERFLOW, CONNECTION_BUDGET
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+worker_class = 'gthread'
+
+# One thread per connection the worker's engine pool can hand out (see db_settings.py),
+# so requests never queue on pool checkout
+connections_per_worker = POOL_SIZE + MAX_OVERFLOW
+threads = connections_per_worker
+
+# Cap workers so every pool together stays within the database's connection budget
+workers = int(os.environ.get(
+    'WEB_CONCURRENCY',
+    max(1, min(multiprocessing.cpu_count() * 2 + 1, CONNECTION_BUDGET // connections_per_worker))
+))
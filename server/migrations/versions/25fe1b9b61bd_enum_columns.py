@@ -0,0 +1,66 @@
+"""enum columns
+
+Convert rsvp_status and priority from VARCHAR(10) to their enum types.
+Existing values are first matched case-insensitively to the allowed ones;
+anything else becomes 'Maybe' (an RSVP without a definite answer) or
+'Medium' (the task default), since the enum can't hold it.
+
+Revision ID: 25fe1b9b61bd
+Revises: d245e4841b1f
+Create Date: 2026-10-15 05:33:10.325713
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '25fe1b9b61bd'
+down_revision = 'd245e4841b1f'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, value for rows matching none of the allowed values, nullable)
+COLUMNS = (
+    ('event_guests', 'rsvp_status', sa.Enum('Yes', 'No', 'Maybe', name='rsvp_status_enum'), 'Maybe', False),
+    ('tasks', 'priority', sa.Enum('High', 'Medium', 'Low', name='task_priority_enum'), 'Medium', True),
+)
+
+
+def normalize(table, column, enum, fallback):
+    rows = sa.table(table, sa.column(column, sa.String()))
+    value = sa.func.lower(sa.func.trim(rows.c[column]))
+    op.execute(rows.update().values({
+        column: sa.case(
+            *((value == allowed.lower(), allowed) for allowed in enum.enums),
+            else_=fallback
+        )
+    }))
+
+
+def upgrade():
+    for table, column, enum, fallback, nullable in COLUMNS:
+        # Creates the PostgreSQL type; SQLite stores enums as VARCHAR and skips this
+        enum.create(op.get_bind(), checkfirst=True)
+        normalize(table, column, enum, fallback)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=10),
+                type_=enum,
+                existing_nullable=nullable,
+                postgresql_using=f'{column}::{enum.name}'
+            )
+
+
+def downgrade():
+    for table, column, enum, fallback, nullable in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=enum,
+                type_=sa.String(length=10),
+                existing_nullable=nullable,
+                postgresql_using=f'{column}::text'
+            )
+        enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,40 @@
+"""timestamp server defaults
+
+created_at and updated_at are filled in by the database rather than by
+Python-side defaults, so existing tables need the column defaults added.
+
+Revision ID: 5301a851608f
+Revises: be3a8f7229a1
+Create Date: 2026-10-15 05:27:02.118406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5301a851608f'
+down_revision = 'be3a8f7229a1'
+branch_labels = None
+depends_on = None
+
+TABLES = ('events', 'event_guests', 'tasks')
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), server_default=sa.func.now())
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True), server_default=sa.func.now())
+
+        # Rows written without a timestamp before the defaults existed
+        timestamps = sa.table(table, sa.column('created_at'), sa.column('updated_at'))
+        op.execute(timestamps.update().where(timestamps.c.created_at.is_(None)).values(created_at=sa.func.now()))
+        op.execute(timestamps.update().where(timestamps.c.updated_at.is_(None)).values(updated_at=sa.func.now()))
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), server_default=None)
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True), server_default=None)
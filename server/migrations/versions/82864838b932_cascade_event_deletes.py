@@ -0,0 +1,46 @@
+"""cascade event deletes
+
+Rebuild the event foreign keys on event_guests and tasks with ON DELETE
+CASCADE, which deleting an event now relies on (passive_deletes).
+
+Revision ID: 82864838b932
+Revises: 5301a851608f
+Create Date: 2026-10-15 05:25:50.045110
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '82864838b932'
+down_revision = '5301a851608f'
+branch_labels = None
+depends_on = None
+
+TABLES = ('event_guests', 'tasks')
+
+# SQLite reports the original foreign keys without a name; batch mode names
+# them with this convention so they can be dropped
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def replace_event_fk(table, ondelete):
+    inspector = sa.inspect(op.get_bind())
+    fk_name = next(
+        fk['name'] for fk in inspector.get_foreign_keys(table) if fk['referred_table'] == 'events'
+    ) or f'fk_{table}_event_id_events'
+
+    with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(fk_name, type_='foreignkey')
+        batch_op.create_foreign_key(fk_name, 'events', ['event_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    for table in TABLES:
+        replace_event_fk(table, ondelete='CASCADE')
+
+
+def downgrade():
+    for table in TABLES:
+        replace_event_fk(table, ondelete=None)
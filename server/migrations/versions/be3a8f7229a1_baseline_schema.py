@@ -0,0 +1,72 @@
+"""baseline schema
+
+The tables as db.create_all() built them before migrations were introduced.
+Databases created that way already have them, so only missing tables are
+created and `flask db upgrade` can run on both new and existing databases.
+
+Revision ID: be3a8f7229a1
+Revises:
+Create Date: 2026-10-15 05:25:24.658639
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'be3a8f7229a1'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'events' not in existing_tables:
+        op.create_table('events',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('location', sa.String(length=300), nullable=True),
+            sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'event_guests' not in existing_tables:
+        op.create_table('event_guests',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('event_id', sa.Integer(), nullable=False),
+            sa.Column('guest_name', sa.String(length=100), nullable=False),
+            sa.Column('guest_email', sa.String(length=200), nullable=False),
+            sa.Column('rsvp_status', sa.String(length=10), nullable=False),
+            sa.Column('note_to_host', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(['event_id'], ['events.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('event_id', 'guest_email', name='unique_event_guest_email')
+        )
+
+    if 'tasks' not in existing_tables:
+        op.create_table('tasks',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('event_id', sa.Integer(), nullable=False),
+            sa.Column('description', sa.Text(), nullable=False),
+            sa.Column('completed', sa.Boolean(), nullable=False),
+            sa.Column('assigned_to', sa.String(length=100), nullable=True),
+            sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('priority', sa.String(length=10), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(['event_id'], ['events.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('tasks')
+    op.drop_table('event_guests')
+    op.drop_table('events')
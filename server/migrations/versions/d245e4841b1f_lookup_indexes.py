@@ -0,0 +1,37 @@
+"""lookup indexes
+
+Indexes behind the per-event RSVP summary and task queries, which
+databases created before migrations don't have.
+
+Revision ID: d245e4841b1f
+Revises: 82864838b932
+Create Date: 2026-10-15 05:26:09.996055
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd245e4841b1f'
+down_revision = '82864838b932'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_event_guests_event_status', 'event_guests', ['event_id', 'rsvp_status']),
+    ('ix_tasks_event_completed', 'tasks', ['event_id', 'completed']),
+    ('ix_tasks_event_created_desc', 'tasks', ['event_id', sa.text('created_at DESC')]),
+)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, columns in INDEXES:
+        op.drop_index(name, table_name=table)
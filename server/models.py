@@ -1,299 +1,385 @@
-from datetime import datetime, timezone
+from itertools import islice
 
-class Event:
-    """
-    Event model - this is a base class that will be converted to SQLAlchemy model
-    """
-    pass
+from extensions import db
+
+RSVP_STATUSES = ('Yes', 'No', 'Maybe')
+TASK_PRIORITIES = ('High', 'Medium', 'Low')
+
+def empty_rsvp_summary():
+    """RSVP summary for an event with no responses"""
+    return {'total': 0, 'yes': 0, 'no': 0, 'maybe': 0}
 
-class EventGuest:
+def bulk_insert(model, rows, batch_size=10000):
     """
-    EventGuest model - this is a base class that will be converted to SQLAlchemy model
+    Insert many rows for a model in batched multi-row INSERTs, leaving the commit to the caller
+    
+    Args:
+        model: Mapped model class
+        rows (iterable): Dictionaries of column values
+        batch_size (int, optional): Rows per INSERT batch. Defaults to 10000.
     """
-    pass
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        db.session.execute(db.insert(model), batch)
 
-def create_models(db):
+class Event(db.Model):
+    # Define table name explicitly
+    __tablename__ = 'events'
+    
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Event details
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, default='')
+    location = db.Column(db.String(300), default='')
+    date = db.Column(db.DateTime(timezone=True), nullable=False)
+    
+    # Metadata
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now())
+    
+    # Relationships to RSVPs and tasks; never lazy-loaded, callers opt in with selectinload().
+    # Deleting an event leaves the child rows to the database's ON DELETE CASCADE.
+    rsvps = db.relationship('EventGuest', backref='event', lazy='raise', cascade='all, delete-orphan', passive_deletes=True)
+    tasks = db.relationship('Task', backref='event', lazy='raise', cascade='all, delete-orphan', passive_deletes=True)
+    
+    def __init__(self, title, description='', location='', date=None):
+        """Initialize a new Event instance"""
+        self.title = title
+        self.description = description
+        self.location = location
+        self.date = date
+    
+    def __repr__(self):
+        """String representation of Event for debugging"""
+        return f'<Event {self.id}: {self.title} on {self.date}>'
+    
+    def to_dict(self):
+        """Convert Event instance to dictionary for JSON serialization (datetimes are left to orjson)"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'location': self.location,
+            'date': self.date,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+    
+    def get_rsvp_summary(self):
+        """Get RSVP summary for this event with a grouped count query, without loading the RSVPs"""
+        return EventGuest.get_rsvp_summaries(self.id).get(self.id, empty_rsvp_summary())
+    
+    @classmethod
+    def bulk_create(cls, rows):
+        """
+        Insert many events at once without committing
+        
+        Args:
+            rows (iterable): Dictionaries of Event column values
+        """
+        bulk_insert(cls, rows)
+
+class EventGuest(db.Model):
     """
-    Create SQLAlchemy models with the database instance
-    This function should be called from app.py after db is initialized
+    EventGuest model - represents an RSVP to an event
+    This is an association model that connects events with guest responses
     """
+    __tablename__ = 'event_guests'
     
-    class Event(db.Model):
-        # Define table name explicitly
-        __tablename__ = 'events'
-        
-        # Primary key
-        id = db.Column(db.Integer, primary_key=True)
-        
-        # Event details
-        title = db.Column(db.String(200), nullable=False)
-        description = db.Column(db.Text, default='')
-        location = db.Column(db.String(300), default='')
-        date = db.Column(db.DateTime(timezone=True), nullable=False)
-        
-        # Metadata
-        created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-        updated_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-        
-        # Relationship to RSVPs
-        rsvps = db.relationship('EventGuest', backref='event', lazy=True, cascade='all, delete-orphan')
-        
-        def __init__(self, title, description='', location='', date=None):
-            """Initialize a new Event instance"""
-            self.title = title
-            self.description = description
-            self.location = location
-            self.date = date
-        
-        def __repr__(self):
-            """String representation of Event for debugging"""
-            return f'<Event {self.id}: {self.title} on {self.date}>'
-        
-        def to_dict(self):
-            """Convert Event instance to dictionary for JSON serialization"""
-            return {
-                'id': self.id,
-                'title': self.title,
-                'description': self.description,
-                'location': self.location,
-                'date': self.date.isoformat() if self.date else None,
-                'created_at': self.created_at.isoformat() if self.created_at else None,
-                'updated_at': self.updated_at.isoformat() if self.updated_at else None
-            }
-        
-        def get_rsvp_summary(self):
-            """Get RSVP summary for this event"""
-            yes_count = len([r for r in self.rsvps if r.rsvp_status == 'Yes'])
-            no_count = len([r for r in self.rsvps if r.rsvp_status == 'No'])
-            maybe_count = len([r for r in self.rsvps if r.rsvp_status == 'Maybe'])
-            
-            return {
-                'total': len(self.rsvps),
-                'yes': yes_count,
-                'no': no_count,
-                'maybe': maybe_count
-            }
-    
-    class EventGuest(db.Model):
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Foreign key to Event
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id', ondelete='CASCADE'), nullable=False)
+    
+    # Guest information (for now, we'll use simple fields)
+    # In a real app with authentication, this would be user_id
+    guest_name = db.Column(db.String(100), nullable=False)
+    guest_email = db.Column(db.String(200), nullable=False)
+    
+    # RSVP details
+    rsvp_status = db.Column(db.Enum(*RSVP_STATUSES, name='rsvp_status_enum', validate_strings=True), nullable=False)
+    note_to_host = db.Column(db.Text, default='')
+    
+    # Metadata
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now())
+    
+    # Unique constraint to prevent duplicate RSVPs from same email for same event
+    __table_args__ = (
+        db.UniqueConstraint('event_id', 'guest_email', name='unique_event_guest_email'),
+        # Serves the per-status GROUP BY in get_rsvp_summaries as an index-only scan
+        db.Index('ix_event_guests_event_status', 'event_id', 'rsvp_status'),
+    )
+    
+    def __init__(self, event_id, guest_name, guest_email, rsvp_status, note_to_host=''):
         """
-        EventGuest model - represents an RSVP to an event
-        This is an association model that connects events with guest responses
+        Initialize a new EventGuest (RSVP) instance
+        
+        Args:
+            event_id (int): ID of the event
+            guest_name (str): Name of the guest
+            guest_email (str): Email of the guest
+            rsvp_status (str): 'Yes', 'No', or 'Maybe'
+            note_to_host (str, optional): Optional note to the host
         """
-        __tablename__ = 'event_guests'
-        
-        # Primary key
-        id = db.Column(db.Integer, primary_key=True)
-        
-        # Foreign key to Event
-        event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
-        
-        # Guest information (for now, we'll use simple fields)
-        # In a real app with authentication, this would be user_id
-        guest_name = db.Column(db.String(100), nullable=False)
-        guest_email = db.Column(db.String(200), nullable=False)
-        
-        # RSVP details
-        rsvp_status = db.Column(db.String(10), nullable=False)  # 'Yes', 'No', 'Maybe'
-        note_to_host = db.Column(db.Text, default='')
-        
-        # Metadata
-        created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-        updated_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-        
-        # Unique constraint to prevent duplicate RSVPs from same email for same event
-        __table_args__ = (
-            db.UniqueConstraint('event_id', 'guest_email', name='unique_event_guest_email'),
-        )
+        self.event_id = event_id
+        self.guest_name = guest_name
+        self.guest_email = guest_email
+        self.rsvp_status = rsvp_status
+        self.note_to_host = note_to_host
+    
+    def __repr__(self):
+        """String representation for debugging"""
+        return f'<EventGuest {self.guest_name} - {self.rsvp_status} for Event {self.event_id}>'
+    
+    def to_dict(self):
+        """Convert EventGuest instance to dictionary for JSON serialization (datetimes are left to orjson)"""
+        return {
+            'id': self.id,
+            'event_id': self.event_id,
+            'guest_name': self.guest_name,
+            'guest_email': self.guest_email,
+            'rsvp_status': self.rsvp_status,
+            'note_to_host': self.note_to_host,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+    
+    @classmethod
+    def get_rsvp_by_email_and_event(cls, event_id, guest_email):
+        """
+        Get the ID of an existing RSVP for a guest at a specific event
         
-        def __init__(self, event_id, guest_name, guest_email, rsvp_status, note_to_host=''):
-            """
-            Initialize a new EventGuest (RSVP) instance
+        Args:
+            event_id (int): Event ID
+            guest_email (str): Guest email
             
-            Args:
-                event_id (int): ID of the event
-                guest_name (str): Name of the guest
-                guest_email (str): Email of the guest
-                rsvp_status (str): 'Yes', 'No', or 'Maybe'
-                note_to_host (str, optional): Optional note to the host
-            """
-            self.event_id = event_id
-            self.guest_name = guest_name
-            self.guest_email = guest_email
-            self.rsvp_status = rsvp_status
-            self.note_to_host = note_to_host
-        
-        def __repr__(self):
-            """String representation for debugging"""
-            return f'<EventGuest {self.guest_name} - {self.rsvp_status} for Event {self.event_id}>'
-        
-        def to_dict(self):
-            """Convert EventGuest instance to dictionary for JSON serialization"""
-            return {
-                'id': self.id,
-                'event_id': self.event_id,
-                'guest_name': self.guest_name,
-                'guest_email': self.guest_email,
-                'rsvp_status': self.rsvp_status,
-                'note_to_host': self.note_to_host,
-                'created_at': self.created_at.isoformat() if self.created_at else None,
-                'updated_at': self.updated_at.isoformat() if self.updated_at else None
-            }
+        Returns:
+            int or None: ID of the existing RSVP if found
+        """
+        return db.session.execute(_RSVP_ID_BY_EVENT_AND_EMAIL, {'event_id': event_id, 'guest_email': guest_email}).scalar()
+    
+    @classmethod
+    def get_rsvp_summaries(cls, event_id=None):
+        """
+        Count RSVPs per event and status with a single grouped query
         
-        @classmethod
-        def get_rsvp_by_email_and_event(cls, event_id, guest_email):
-            """
-            Get existing RSVP for a guest at a specific event
+        Args:
+            event_id (int, optional): Restrict the counts to one event. Defaults to all events.
             
-            Args:
-                event_id (int): Event ID
-                guest_email (str): Guest email
-                
-            Returns:
-                EventGuest or None: Existing RSVP if found
-            """
-            return cls.query.filter_by(event_id=event_id, guest_email=guest_email).first()
+        Returns:
+            dict: Maps event ID to its RSVP summary; events without RSVPs are absent
+        """
+        stmt = db.select(cls.event_id, cls.rsvp_status, db.func.count()).group_by(cls.event_id, cls.rsvp_status)
+        if event_id is not None:
+            stmt = stmt.where(cls.event_id == event_id)
+        
+        summaries = {}
+        for summary_event_id, rsvp_status, count in db.session.execute(stmt):
+            summary = summaries.setdefault(summary_event_id, empty_rsvp_summary())
+            summary[rsvp_status.lower()] = count
+            summary['total'] += count
+        return summaries
+    
+    @classmethod
+    def get_rsvps_for_event(cls, event_id):
+        """
+        Get all RSVPs for a specific event
         
-        @classmethod
-        def get_rsvps_for_event(cls, event_id):
-            """
-            Get all RSVPs for a specific event
+        Args:
+            event_id (int): Event ID
             
-            Args:
-                event_id (int): Event ID
-                
-            Returns:
-                list: List of EventGuest instances
-            """
-            return cls.query.filter_by(event_id=event_id).all()
-        
-        def save(self):
-            """Save the current RSVP to database"""
-            db.session.add(self)
-            db.session.commit()
+        Returns:
+            list: List of EventGuest instances
+        """
+        return db.session.execute(_RSVPS_FOR_EVENT, {'event_id': event_id}).scalars().all()
+    
+    @classmethod
+    def bulk_create(cls, rows):
+        """
+        Insert many RSVPs at once without committing
         
-        def delete(self):
-            """Delete the current RSVP from database"""
-            db.session.delete(self)
-            db.session.commit()
+        Args:
+            rows (iterable): Dictionaries of EventGuest column values
+        """
+        bulk_insert(cls, rows)
+    
+    def add(self):
+        """Stage the current RSVP in the session; the caller commits"""
+        db.session.add(self)
+    
+    def mark_delete(self):
+        """Stage deletion of the current RSVP; the caller commits"""
+        db.session.delete(self)
+
+# Lookup statements built once and reused with bound parameters
+_RSVP_ID_BY_EVENT_AND_EMAIL = db.select(EventGuest.id).where(
+    EventGuest.event_id == db.bindparam('event_id'),
+    EventGuest.guest_email == db.bindparam('guest_email')
+)
+_RSVPS_FOR_EVENT = db.select(EventGuest).where(EventGuest.event_id == db.bindparam('event_id'))
+
+class Task(db.Model):
+    """
+    Task model - represents a task associated with an event
+    This model handles to-do items for event planning
+    """
+    __tablename__ = 'tasks'
     
-    class Task(db.Model):
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Foreign key to Event
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id', ondelete='CASCADE'), nullable=False)
+    
+    # Task details
+    description = db.Column(db.Text, nullable=False)
+    completed = db.Column(db.Boolean, default=False, nullable=False)
+    
+    # Optional fields
+    assigned_to = db.Column(db.String(100), default='')  # Who is responsible
+    due_date = db.Column(db.DateTime(timezone=True))  # Optional due date
+    priority = db.Column(db.Enum(*TASK_PRIORITIES, name='task_priority_enum', validate_strings=True), default='Medium')
+    
+    # Metadata
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now())
+    
+    # Indexes for the per-event lookups below
+    __table_args__ = (
+        db.Index('ix_tasks_event_completed', 'event_id', 'completed'),
+        # Matches get_tasks_for_event's ORDER BY so rows come back in index order without a sort
+        db.Index('ix_tasks_event_created_desc', 'event_id', db.text('created_at DESC')),
+    )
+    
+    def __init__(self, event_id, description, completed=False, assigned_to='', due_date=None, priority='Medium'):
         """
-        Task model - represents a task associated with an event
-        This model handles to-do items for event planning
+        Initialize a new Task instance
+        
+        Args:
+            event_id (int): ID of the associated event
+            description (str): Task description
+            completed (bool, optional): Whether task is completed. Defaults to False.
+            assigned_to (str, optional): Person assigned to task. Defaults to ''.
+            due_date (datetime, optional): Due date for task. Defaults to None.
+            priority (str, optional): Task priority. Defaults to 'Medium'.
         """
-        __tablename__ = 'tasks'
-        
-        # Primary key
-        id = db.Column(db.Integer, primary_key=True)
-        
-        # Foreign key to Event
-        event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
-        
-        # Task details
-        description = db.Column(db.Text, nullable=False)
-        completed = db.Column(db.Boolean, default=False, nullable=False)
-        
-        # Optional fields
-        assigned_to = db.Column(db.String(100), default='')  # Who is responsible
-        due_date = db.Column(db.DateTime(timezone=True))  # Optional due date
-        priority = db.Column(db.String(10), default='Medium')  # High, Medium, Low
-        
-        # Metadata
-        created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-        updated_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-        
-        def __init__(self, event_id, description, completed=False, assigned_to='', due_date=None, priority='Medium'):
-            """
-            Initialize a new Task instance
-            
-            Args:
-                event_id (int): ID of the associated event
-                description (str): Task description
-                completed (bool, optional): Whether task is completed. Defaults to False.
-                assigned_to (str, optional): Person assigned to task. Defaults to ''.
-                due_date (datetime, optional): Due date for task. Defaults to None.
-                priority (str, optional): Task priority. Defaults to 'Medium'.
-            """
-            self.event_id = event_id
-            self.description = description
-            self.completed = completed
-            self.assigned_to = assigned_to
-            self.due_date = due_date
-            self.priority = priority
-        
-        def __repr__(self):
-            """String representation for debugging"""
-            status = "✅" if self.completed else "❌"
-            return f'<Task {self.id}: {status} {self.description[:50]}... for Event {self.event_id}>'
-        
-        def to_dict(self):
-            """Convert Task instance to dictionary for JSON serialization"""
-            return {
-                'id': self.id,
-                'event_id': self.event_id,
-                'description': self.description,
-                'completed': self.completed,
-                'assigned_to': self.assigned_to,
-                'due_date': self.due_date.isoformat() if self.due_date else None,
-                'priority': self.priority,
-                'created_at': self.created_at.isoformat() if self.created_at else None,
-                'updated_at': self.updated_at.isoformat() if self.updated_at else None
-            }
+        self.event_id = event_id
+        self.description = description
+        self.completed = completed
+        self.assigned_to = assigned_to
+        self.due_date = due_date
+        self.priority = priority
+    
+    def __repr__(self):
+        """String representation for debugging"""
+        status = "✅" if self.completed else "❌"
+        return f'<Task {self.id}: {status} {self.description:.50}... for Event {self.event_id}>'
+    
+    def to_dict(self):
+        """Convert Task instance to dictionary for JSON serialization (datetimes are left to orjson)"""
+        return {
+            'id': self.id,
+            'event_id': self.event_id,
+            'description': self.description,
+            'completed': self.completed,
+            'assigned_to': self.assigned_to,
+            'due_date': self.due_date,
+            'priority': self.priority,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+    
+    @classmethod
+    def get_tasks_for_event(cls, event_id):
+        """
+        Get all tasks for a specific event
         
-        @classmethod
-        def get_tasks_for_event(cls, event_id):
-            """
-            Get all tasks for a specific event
+        Args:
+            event_id (int): Event ID
             
-            Args:
-                event_id (int): Event ID
-                
-            Returns:
-                list: List of Task instances
-            """
-            return cls.query.filter_by(event_id=event_id).order_by(cls.created_at.desc()).all()
+        Returns:
+            list: List of Task instances
+        """
+        return db.session.execute(_TASKS_FOR_EVENT, {'event_id': event_id}).scalars().all()
+    
+    @classmethod
+    def get_completed_tasks_for_event(cls, event_id):
+        """
+        Get completed tasks for a specific event
         
-        @classmethod
-        def get_completed_tasks_for_event(cls, event_id):
-            """
-            Get completed tasks for a specific event
+        Args:
+            event_id (int): Event ID
             
-            Args:
-                event_id (int): Event ID
-                
-            Returns:
-                list: List of completed Task instances
-            """
-            return cls.query.filter_by(event_id=event_id, completed=True).all()
+        Returns:
+            list: List of completed Task instances
+        """
+        return db.session.execute(_TASKS_FOR_EVENT_BY_STATUS, {'event_id': event_id, 'completed': True}).scalars().all()
+    
+    @classmethod
+    def get_pending_tasks_for_event(cls, event_id):
+        """
+        Get pending (not completed) tasks for a specific event
         
-        @classmethod
-        def get_pending_tasks_for_event(cls, event_id):
-            """
-            Get pending (not completed) tasks for a specific event
+        Args:
+            event_id (int): Event ID
             
-            Args:
-                event_id (int): Event ID
-                
-            Returns:
-                list: List of pending Task instances
-            """
-            return cls.query.filter_by(event_id=event_id, completed=False).all()
-        
-        def save(self):
-            """Save the current task to database"""
-            db.session.add(self)
-            db.session.commit()
+        Returns:
+            list: List of pending Task instances
+        """
+        return db.session.execute(_TASKS_FOR_EVENT_BY_STATUS, {'event_id': event_id, 'completed': False}).scalars().all()
+    
+    @classmethod
+    def bulk_create(cls, rows):
+        """
+        Insert many tasks at once without committing
         
-        def delete(self):
-            """Delete the current task from database"""
-            db.session.delete(self)
-            db.session.commit()
+        Args:
+            rows (iterable): Dictionaries of Task column values
+        """
+        bulk_insert(cls, rows)
+    
+    def add(self):
+        """Stage the current task in the session; the caller commits"""
+        db.session.add(self)
+    
+    def mark_delete(self):
+        """Stage deletion of the current task; the caller commits"""
+        db.session.delete(self)
+    
+    @classmethod
+    def toggle(cls, task_id):
+        """
+        Flip a task's completion status with a single UPDATE, without loading the row;
+        the caller commits
         
-        def toggle_completion(self):
-            """Toggle the completion status of the task"""
-            self.completed = not self.completed
-            self.updated_at = datetime.now(timezone.utc)
-            db.session.commit()
+        Args:
+            task_id (int): Task ID
+            
+        Returns:
+            bool: True if the task exists and was toggled
+        """
+        result = db.session.execute(
+            db.update(cls)
+            .where(cls.id == task_id)
+            .values(completed=~cls.completed, updated_at=db.func.now())
+        )
+        return result.rowcount > 0
     
-    return Event, EventGuest, Task
+    def toggle_completion(self):
+        """Toggle the completion status of the task; the caller commits"""
+        self.toggle(self.id)
 
+# Lookup statements built once and reused with bound parameters
+_TASKS_FOR_EVENT = (
+    db.select(Task)
+    .where(Task.event_id == db.bindparam('event_id'))
+    .order_by(Task.created_at.desc())
+)
+_TASKS_FOR_EVENT_BY_STATUS = db.select(Task).where(
+    Task.event_id == db.bindparam('event_id'),
+    Task.completed == db.bindparam('completed')
+)
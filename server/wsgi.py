@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers
+
+Run from the server directory, e.g.:
+    flask --app app init-db     # new database
+    flask --app app db upgrade  # database created before migrations
+    gunicorn wsgi:app           # settings in gunicorn.conf.py
+"""
+from app import app
+
+__all__ = ['app']